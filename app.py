@@ -4,28 +4,88 @@ FastAPI应用 - PDF处理服务
 """
 
 from fastapi import FastAPI, File, UploadFile, HTTPException
-from fastapi.responses import JSONResponse
-import json
-import tempfile
+from pydantic import BaseModel
+from typing import Any
 import os
-import asyncio
+import fcntl
+import stat
+from contextlib import asynccontextmanager
 from pathlib import Path
 import sys
 
 # 添加项目根目录到Python路径
 sys.path.insert(0, str(Path(__file__).parent))
 
-from utils.utils import process_pdf_file
-from config.config import OCR_API_URL, DEFAULT_LONGEST_SIDE
+from utils.utils import process_pdf_file, close_http_client, start_render_pool, shutdown_render_pool
+from config.config import OCR_API_URL, DEFAULT_LONGEST_SIDE, MAX_CONCURRENT_TASKS, PROCESSING_LOCK_DIR
+
+@asynccontextmanager
+async def lifespan(app):
+    """应用生命周期：启动时准备处理名额锁目录并创建页面渲染进程池，关闭时释放进程池和OCR服务的HTTP连接池"""
+    prepare_processing_lock_dir()
+    # 渲染进程数按 WEB_CONCURRENCY 与处理名额数中较小者平分CPU核数
+    start_render_pool(int(os.getenv("WEB_CONCURRENCY", "1")))
+    try:
+        yield
+    finally:
+        shutdown_render_pool()
+        await close_http_client()
 
 # 创建FastAPI应用
 app = FastAPI(
     title="PDF处理服务",
     description="提供PDF文件处理和布局解析功能的API服务",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 
+class ProcessPdfResponse(BaseModel):
+    """PDF处理接口的返回结果，由FastAPI按此模型直接序列化"""
+    success: bool
+    filename: str
+    total_pages: int
+    results: list[dict[str, Any]]
+
+
+def prepare_processing_lock_dir():
+    """
+    创建处理名额文件锁所在目录（启动时调用一次）
+    
+    目录可能位于共享的临时目录下，要求其为当前用户所有、不是符号链接且其他用户不可写，
+    防止被他人预先创建或替换
+    
+    Raises:
+        RuntimeError: 目录不满足上述要求
+    """
+    os.makedirs(PROCESSING_LOCK_DIR, mode=0o700, exist_ok=True)
+    st = os.lstat(PROCESSING_LOCK_DIR)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o022:
+        raise RuntimeError(f"处理名额锁目录不安全: {PROCESSING_LOCK_DIR}")
+
+def acquire_processing_slot():
+    """
+    尝试获取一个处理名额（跨进程文件锁，多worker共享）
+    
+    Returns:
+        int or None: 持有锁的文件描述符，名额已满时返回None
+    """
+    for i in range(MAX_CONCURRENT_TASKS):
+        lock_path = os.path.join(PROCESSING_LOCK_DIR, f"pdf_slot_{i}.lock")
+        # O_NOFOLLOW：锁文件若被替换为符号链接则拒绝打开
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return fd
+        except BlockingIOError:
+            os.close(fd)
+    return None
+
+def release_processing_slot(fd):
+    """释放处理名额"""
+    fcntl.flock(fd, fcntl.LOCK_UN)
+    os.close(fd)
+
 
 @app.get("/health")
 async def health_check():
@@ -39,7 +99,7 @@ async def health_check():
         "version": "1.0.0"
     }
 
-@app.post("/process-pdf")
+@app.post("/process-pdf", response_model=ProcessPdfResponse)
 async def process_pdf(
     file: UploadFile = File(..., description="PDF文件"),
     api_url: str = OCR_API_URL,
@@ -60,7 +120,16 @@ async def process_pdf(
     """
     print(f"[DEBUG] 收到PDF处理请求")
     
+    slot_fd = None
     try:
+        # 准入控制：达到并发上限时直接拒绝，而不是排队等待
+        slot_fd = acquire_processing_slot()
+        if slot_fd is None:
+            raise HTTPException(
+                status_code=429,
+                detail="服务繁忙，请稍后重试"
+            )
+        
         # 检查文件类型
         if not file.filename.lower().endswith('.pdf'):
             raise HTTPException(
@@ -68,45 +137,34 @@ async def process_pdf(
                 detail="仅支持PDF文件"
             )
         
-        # 读取上传的文件内容
-        file_content = await file.read()
+        # 读取上传的文件内容，直接在内存中处理，不再落盘为临时文件
+        pdf_bytes = await file.read()
         
-        # 使用临时文件处理
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            temp_file.write(file_content)
-            temp_file_path = temp_file.name
+        # 处理PDF文件
+        result_data = await process_pdf_file(
+            pdf_input=pdf_bytes,
+            api_url=api_url,
+            longest_side=longest_side
+        )
         
-        try:
-            # 处理PDF文件
-            result_json = process_pdf_file(
-                pdf_input=temp_file_path,
-                api_url=api_url,
-                longest_side=longest_side
-            )
-            
-            # 解析JSON结果
-            result_data = json.loads(result_json)
-            
-            return JSONResponse(
-                content={
-                    "success": True,
-                    "filename": file.filename,
-                    "total_pages": len(result_data),
-                    "results": result_data
-                },
-                status_code=200
-            )
-            
-        finally:
-            # 清理临时文件
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
-                
+        return {
+            "success": True,
+            "filename": file.filename,
+            "total_pages": len(result_data),
+            "results": result_data
+        }
+        
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, 
             detail=f"处理PDF文件时发生错误: {str(e)}"
         )
+    finally:
+        # 释放处理名额
+        if slot_fd is not None:
+            release_processing_slot(slot_fd)
 
 @app.get("/")
 async def root():
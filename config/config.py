@@ -1,21 +1,49 @@
 # 配置文件
 
+import os
+import tempfile
+
 # 默认图像最长边大小
 DEFAULT_LONGEST_SIDE = 1280
 
+# 发送给OCR服务的页面图像JPEG质量
+JPEG_QUALITY = 90
+
+# 同时处理的PDF任务数上限（所有worker进程共享），超出时返回429
+MAX_CONCURRENT_TASKS = 1
+
+# 处理名额文件锁所在目录，可通过环境变量 PROCESSING_LOCK_DIR 指定；
+# 默认为当前用户的运行时目录（XDG_RUNTIME_DIR，未设置时为系统临时目录）下按用户区分的子目录
+PROCESSING_LOCK_DIR = os.getenv("PROCESSING_LOCK_DIR") or os.path.join(
+    os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir(), f"paddle-server-{os.getuid()}"
+)
+
+# 每个渲染进程分到的页码区间数：区间越多，首批请求越早发出，但PDF内容需要随每个区间传给渲染进程
+RENDER_CHUNKS_PER_PROCESS = 4
+
 # API配置
+# timeout：单次请求的读写超时（秒）；任一页超时会取消整个PDF的处理，因此留足OCR服务处理单页的时间
 API_CONFIG = {
-    "timeout": 30,
-    "max_retries": 3
+    "timeout": 60,
+    "max_retries": 3,
+    "max_concurrency": 8,
+    "max_connections": 16
 }
 
 # OCR服务配置
 OCR_API_URL = "http://192.168.48.180:7999/layout-parsing"
 
+# 输出结果中固定的OCR后端信息
+OCR_RESULT_BACKEND = "pipeline"
+OCR_RESULT_VERSION = "2.5.4"
+
 # 服务器配置
 SERVER_CONFIG = {
     "host": "0.0.0.0",
     "port": 8000,
     "reload": True,
-    "log_level": "info"
+    "workers": 4,
+    "log_level": "info",
+    "loop": "uvloop",
+    "http": "httptools"
 }
\ No newline at end of file
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+测试process-pdf接口的准入控制
+处理名额被占用时，接口应直接返回429
+"""
+
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+
+
+def test_busy_returns_429(monkeypatch, tmp_path):
+    """名额被占用时返回429，释放后请求可以通过准入控制"""
+    monkeypatch.setattr(app_module, "PROCESSING_LOCK_DIR", str(tmp_path))
+    client = TestClient(app_module.app)
+    files = {"file": ("test.txt", b"not a pdf", "text/plain")}
+    
+    slot_fd = app_module.acquire_processing_slot()
+    assert slot_fd is not None
+    try:
+        response = client.post("/process-pdf", files=files)
+        assert response.status_code == 429
+    finally:
+        app_module.release_processing_slot(slot_fd)
+    
+    # 名额释放后，请求进入处理流程（非PDF文件返回400）
+    response = client.post("/process-pdf", files=files)
+    assert response.status_code == 400
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
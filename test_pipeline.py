@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+测试PDF处理流程与OCR服务的交互
+使用httpx.MockTransport代替OCR服务，检查请求体、结果顺序和错误处理
+"""
+
+import asyncio
+import sys
+
+import fitz
+import httpx
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+from utils import utils
+
+
+def make_pdf(page_count):
+    """生成指定页数的测试PDF，每页写有页码"""
+    doc = fitz.open()
+    for i in range(page_count):
+        doc.new_page().insert_text((72, 72), f"page {i + 1}")
+    return doc.tobytes()
+
+
+def use_mock_ocr(monkeypatch, status_code=200):
+    """
+    用MockTransport替换OCR服务的HTTP客户端
+
+    Returns:
+        list: 收到的请求体（已用orjson解析），按到达顺序排列
+    """
+    bodies = []
+
+    async def handler(request):
+        body = orjson.loads(request.content)
+        bodies.append(body)
+        # 让后到的请求先返回，确认结果仍按页顺序排列
+        await asyncio.sleep(0.02 / len(bodies))
+        if status_code != 200:
+            return httpx.Response(status_code, text="OCR failed")
+        return httpx.Response(200, content=orjson.dumps({
+            "result": {"layoutParsingResults": [{"markdown": {"text": f"md {len(body['file'])}"}}]}
+        }))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(utils, "_http_client", client)
+    return bodies
+
+
+def test_process_pdf_file_returns_pages_in_order(monkeypatch):
+    """请求体为合法JSON，结果按页顺序返回"""
+    bodies = use_mock_ocr(monkeypatch)
+
+    results = asyncio.run(utils.process_pdf_file(make_pdf(5), "http://ocr/layout-parsing", 320))
+
+    assert len(bodies) == 5
+    for body in bodies:
+        assert body["fileType"] == 1
+        assert isinstance(body["file"], str) and body["file"]
+    assert [page["page"] for page in results] == [1, 2, 3, 4, 5]
+    assert results[0]["ocrContent"]["results"]["image"]["md_content"].startswith("md ")
+
+
+def test_process_pdf_file_raises_on_ocr_error(monkeypatch):
+    """OCR服务返回非200时抛出RuntimeError"""
+    use_mock_ocr(monkeypatch, status_code=500)
+
+    with pytest.raises(RuntimeError, match="OCR API 500"):
+        asyncio.run(utils.process_pdf_file(make_pdf(3), "http://ocr/layout-parsing", 320))
+
+
+def test_endpoint_maps_ocr_error_to_500(monkeypatch, tmp_path):
+    """OCR服务出错时，接口返回500"""
+    monkeypatch.setattr(app_module, "PROCESSING_LOCK_DIR", str(tmp_path))
+    use_mock_ocr(monkeypatch, status_code=500)
+    client = TestClient(app_module.app)
+
+    response = client.post(
+        "/process-pdf",
+        files={"file": ("test.pdf", make_pdf(2), "application/pdf")},
+        params={"longest_side": 320}
+    )
+
+    assert response.status_code == 500
+    assert "OCR API 500" in response.json()["detail"]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
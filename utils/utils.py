@@ -3,18 +3,31 @@ import os
 import numpy as np
 import fitz  # PyMuPDF
 import base64
-import requests
+import asyncio
+import collections
+import httpx
+import orjson
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import pathlib
-import shutil
+import logging
+import multiprocessing
 # 动态导入配置，支持直接运行和包导入两种方式
 try:
-    from ..config.config import DEFAULT_LONGEST_SIDE
+    from ..config.config import (
+        DEFAULT_LONGEST_SIDE, JPEG_QUALITY, API_CONFIG, OCR_RESULT_BACKEND, OCR_RESULT_VERSION,
+        MAX_CONCURRENT_TASKS, RENDER_CHUNKS_PER_PROCESS
+    )
 except ImportError:
     # 直接运行时使用绝对导入
     import sys
     import os
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-    from config.config import DEFAULT_LONGEST_SIDE
+    from config.config import (
+        DEFAULT_LONGEST_SIDE, JPEG_QUALITY, API_CONFIG, OCR_RESULT_BACKEND, OCR_RESULT_VERSION,
+        MAX_CONCURRENT_TASKS, RENDER_CHUNKS_PER_PROCESS
+    )
+
+logger = logging.getLogger(__name__)
 
 def resize_longest_side(image, longest_side=DEFAULT_LONGEST_SIDE):
     """
@@ -29,33 +42,28 @@ def resize_longest_side(image, longest_side=DEFAULT_LONGEST_SIDE):
     """
     # 获取原始尺寸
     height, width = image.shape[:2]
+    longest = max(height, width)
     
-    # 计算缩放比例
-    if width > height:
-        # 宽度是长边
-        scale = longest_side / width
-        new_width = longest_side
-        new_height = int(height * scale)
-    else:
-        # 高度是长边
-        scale = longest_side / height
-        new_height = longest_side
-        new_width = int(width * scale)
+    # 计算缩放后尺寸（整数运算，长边正好等于longest_side，避免浮点舍入误差）
+    # 极端长宽比下短边可能算出0，至少保留1像素，否则cv2.resize会报错
+    new_width = max(1, width * longest_side // longest)
+    new_height = max(1, height * longest_side // longest)
     
-    # 缩放图像
-    resized_image = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_LANCZOS4)
+    # 缩小用INTER_AREA（更快且无锯齿），放大用INTER_CUBIC
+    interpolation = cv2.INTER_AREA if longest_side < longest else cv2.INTER_CUBIC
     
-    return resized_image
+    # 缩放图像
+    return cv2.resize(image, (new_width, new_height), interpolation=interpolation)
 
 def encode_image_to_base64(image_input):
     """
-    将图像编码为Base64字符串，支持文件路径或cv2图像对象
+    将图像编码为Base64数据，支持文件路径或cv2图像对象
     
     Args:
         image_input (str or numpy.ndarray): 图像文件路径或cv2图像对象
         
     Returns:
-        str: Base64编码的图像字符串
+        bytes: Base64编码的图像数据（ASCII字节串，不再解码为str）
         
     Raises:
         TypeError: 如果输入类型不支持
@@ -64,47 +72,82 @@ def encode_image_to_base64(image_input):
         # 输入是文件路径
         with open(image_input, "rb") as file:
             image_bytes = file.read()
-            image_data = base64.b64encode(image_bytes).decode("ascii")
-        return image_data
+        return base64.b64encode(image_bytes)
     elif hasattr(image_input, 'dtype') and hasattr(image_input, 'shape'):
-        # 输入是numpy数组（cv2图像对象）
-        success, encoded_image = cv2.imencode('.png', image_input)
+        # 输入是numpy数组（cv2图像对象），编码为JPEG：比PNG编码快得多，且数据量更小
+        success, encoded_image = cv2.imencode(
+            '.jpg', image_input,
+            [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY, cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+        )
         if not success:
-            raise ValueError("Failed to encode image to PNG format")
-        image_bytes = encoded_image.tobytes()
-        image_data = base64.b64encode(image_bytes).decode("ascii")
-        return image_data
+            raise ValueError("Failed to encode image to JPEG format")
+        # 直接对编码结果的缓冲区做Base64，省去tobytes()拷贝
+        return base64.b64encode(encoded_image)
     else:
         raise TypeError("Unsupported input type. Expected file path (str) or cv2 image object (numpy.ndarray)")
 
 def create_layout_parsing_payload(image_data, file_type=1):
     """
-    创建布局解析API的请求负载
+    创建布局解析API的请求负载（已序列化的JSON请求体）
     
     Args:
-        image_data (str): Base64编码的图像数据或文件URL
+        image_data (bytes or str): Base64编码的图像数据或文件URL
         file_type (int): 文件类型，1表示图像文件
         
     Returns:
-        dict: API请求负载
+        bytes: JSON格式的API请求体
     """
-    return {
-        "file": image_data,
-        "fileType": file_type
-    }
+    if isinstance(image_data, str):
+        # 文件URL可能包含需要转义的字符，交给orjson序列化
+        return orjson.dumps({"file": image_data, "fileType": file_type})
+    # Base64字符集无需JSON转义，直接拼接，请求体只分配一次
+    return b"".join((b'{"file":"', image_data, b'","fileType":%d}' % file_type))
+
+# OCR服务的HTTP客户端，首次使用时创建，跨页面、跨请求复用连接
+_http_client = None
+
+def get_http_client():
+    """
+    获取（必要时创建）OCR服务的HTTP客户端
+    
+    Returns:
+        httpx.AsyncClient: 带连接池和连接重试的异步HTTP客户端
+    """
+    global _http_client
+    if _http_client is None:
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=API_CONFIG["max_connections"],
+                max_keepalive_connections=API_CONFIG["max_connections"]
+            ),
+            retries=API_CONFIG["max_retries"]
+        )
+        _http_client = httpx.AsyncClient(transport=transport, timeout=API_CONFIG["timeout"])
+    return _http_client
+
+async def close_http_client():
+    """关闭OCR服务的HTTP客户端，释放连接池"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
-def call_layout_parsing_api(api_url, payload):
+async def call_layout_parsing_api(api_url, payload):
     """
     调用布局解析API
     
     Args:
         api_url (str): API端点URL
-        payload (dict): 请求负载
+        payload (bytes): JSON格式的API请求体
         
     Returns:
-        requests.Response: API响应对象
+        httpx.Response: API响应对象
     """
-    response = requests.post(api_url, json=payload)
+    response = await get_http_client().post(
+        api_url,
+        content=payload,
+        headers={"Content-Type": "application/json"}
+    )
     return response
 
 def process_layout_parsing_result(response):
@@ -112,168 +155,318 @@ def process_layout_parsing_result(response):
     处理布局解析API的返回结果
     
     Args:
-        response (requests.Response): API响应对象
+        response (httpx.Response): API响应对象
         
     Returns:
         dict: 解析后的结果数据
+        
+    Raises:
+        RuntimeError: 如果API返回非200状态码
     """
-    assert response.status_code == 200
-    return response.json()["result"]
+    if response.status_code != 200:
+        raise RuntimeError(f"OCR API {response.status_code}: {response.text[:500]}")
+    # 直接解析响应字节，省去一次UTF-8解码
+    return orjson.loads(response.content)["result"]
+
+# 页面渲染进程池，由 start_render_pool / shutdown_render_pool 管理；未创建时在当前线程内渲染
+_render_pool = None
+_render_pool_size = 1
+
+# 执行阻塞操作（渲染调度、图像编码）的线程池，避免阻塞事件循环
+# 只用一个线程：PyMuPDF不支持多线程，本进程内的fitz调用必须串行
+_blocking_pool = ThreadPoolExecutor(max_workers=1)
 
-def pdf_to_images(pdf_input, output_dir="temp_images", dpi=300):
+def start_render_pool(server_workers=1):
     """
-    将PDF文件按页转换为PNG图像（使用PyMuPDF替代pdf2image）
+    创建页面渲染进程池
+    
+    使用forkserver启动子进程：子进程不会继承当前进程的文件描述符（如处理名额的文件锁），
+    也避免在多线程进程中fork
+    
+    同时渲染的PDF数不超过处理名额数（MAX_CONCURRENT_TASKS，所有worker共享），
+    因此CPU核数按 min(worker数, 处理名额数) 平分；渲染进程在首次提交任务时才按需启动，
+    未持有处理名额的worker不会占用额外进程
     
     Args:
-        pdf_input (str or file-like object): PDF文件路径或文件对象
-        output_dir (str): 输出目录
-        dpi (int): 图像分辨率（仅为了接口兼容性）
+        server_workers (int): 服务的worker进程数
+    """
+    global _render_pool, _render_pool_size
+    if _render_pool is not None:
+        return
+    concurrent_renders = max(1, min(server_workers, MAX_CONCURRENT_TASKS))
+    _render_pool_size = max(1, (os.cpu_count() or 1) // concurrent_renders)
+    if _render_pool_size > 1:
+        _render_pool = ProcessPoolExecutor(
+            max_workers=_render_pool_size,
+            mp_context=multiprocessing.get_context("forkserver")
+        )
+
+def shutdown_render_pool():
+    """关闭页面渲染进程池"""
+    global _render_pool, _render_pool_size
+    if _render_pool is not None:
+        _render_pool.shutdown(wait=True, cancel_futures=True)
+        _render_pool = None
+        _render_pool_size = 1
+
+def _open_pdf(pdf_source):
+    """
+    打开PDF文档
+    
+    Args:
+        pdf_source (str or bytes): PDF文件路径或PDF文件内容
         
     Returns:
-        list: 生成的图像文件路径列表
+        fitz.Document: PDF文档对象
+    """
+    if isinstance(pdf_source, str):
+        # 输入是文件路径
+        return fitz.open(pdf_source)
+    # 输入是文件内容，直接从内存打开
+    return fitz.open(stream=pdf_source, filetype="pdf")
+
+def pixmap_to_image(pix):
     """
-    # 创建输出目录
-    pathlib.Path(output_dir).mkdir(exist_ok=True)
+    将PyMuPDF的Pixmap转换为cv2图像对象，直接使用像素缓冲区，不经过PNG编码/解码
     
-    image_paths = []
+    Args:
+        pix (fitz.Pixmap): 不带alpha通道的RGB格式Pixmap
+        
+    Returns:
+        numpy.ndarray: BGR格式的cv2图像对象
+    """
+    image = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, 3)
+    return cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+
+def _iter_pages(pdf_source, page_numbers, longest_side):
+    """
+    逐页渲染PDF中指定的页面，每次只生成一页图像
     
-    # 使用PyMuPDF打开PDF - 支持文件路径或文件对象
-    if isinstance(pdf_input, str):
-        # 输入是文件路径
-        doc = fitz.open(pdf_input)
-    else:
-        # 输入是文件对象
-        # 先将文件内容读取到内存中，然后使用fitz.open打开
-        pdf_content = pdf_input.read()
-        doc = fitz.open("pdf", pdf_content)
-    
-    for i in range(len(doc)):
-        # 获取页面
-        page = doc.load_page(i)
+    Args:
+        pdf_source (str or bytes): PDF文件路径或PDF文件内容
+        page_numbers (range): 需要渲染的页码（从0开始）
+        longest_side (int): 渲染后图像最长边的像素大小
         
-        # 将页面转换为图像（矩阵）
-        mat = fitz.Matrix(2.0, 2.0)  # 缩放因子，2.0表示200%质量
-        pix = page.get_pixmap(matrix=mat)
+    Yields:
+        tuple: (页码, BGR格式的cv2图像对象)
+    """
+    doc = _open_pdf(pdf_source)
+    try:
+        for i in page_numbers:
+            # 获取页面
+            page = doc.load_page(i)
+            
+            # 按页面尺寸计算缩放因子，使渲染结果的最长边正好等于longest_side
+            rect = page.rect
+            scale = longest_side / max(rect.width, rect.height)
+            # 固定渲染为3通道RGB（无alpha），后续编码和传输的数据量最小
+            pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False, colorspace=fitz.csRGB)
+            
+            logger.debug("Rendered page %d: %dx%d", i + 1, pix.width, pix.height)
+            yield i, pixmap_to_image(pix)
+    finally:
+        doc.close()
+
+def _render_payloads(pdf_source, page_numbers, longest_side):
+    """
+    渲染PDF中指定的页面并逐页编码为布局解析API的请求体（在渲染进程或阻塞线程池中执行）
+    
+    每页渲染后立即编码，原始像素随即释放，只保留和回传压缩后的请求体
+    
+    Args:
+        pdf_source (str or bytes): PDF文件路径或PDF文件内容
+        page_numbers (range): 需要渲染的页码（从0开始）
+        longest_side (int): 渲染后图像最长边的像素大小
         
-        # 保存图像
-        image_path = pathlib.Path(output_dir) / f"page_{i+1:03d}.png"
-        pix.save(str(image_path))
-        image_paths.append(str(image_path))
+    Returns:
+        list: 与页面顺序一致的API请求体列表
+    """
+    # 调试用：设置环境变量 DEBUG_SAVE_PAGES=<目录> 时，将渲染后的页面图像保存到该目录
+    debug_dir = os.getenv("DEBUG_SAVE_PAGES")
+    payloads = []
+    for i, image in _iter_pages(pdf_source, page_numbers, longest_side):
+        if debug_dir:
+            cv2.imwrite(os.path.join(debug_dir, f"page_{i+1:03d}.png"), image)
+        image_data = encode_image_to_base64(image)
+        logger.debug("第 %d 页Base64编码完成，图像尺寸: %s，数据长度: %d 字符", i + 1, image.shape[:2], len(image_data))
+        payloads.append(create_layout_parsing_payload(image_data))
+    return payloads
+
+def _load_pdf(pdf_input):
+    """
+    读取PDF输入并统计页数
+    
+    Args:
+        pdf_input (str, bytes or file-like object): PDF文件路径、PDF文件内容或文件对象
         
-        print(f"Saved page {i+1} as {image_path}")
+    Returns:
+        tuple: (PDF文件路径或PDF文件内容, 总页数)；文件对象会先读取为bytes，便于传给渲染进程
+    """
+    if isinstance(pdf_input, (str, bytes)):
+        pdf_source = pdf_input
+    else:
+        pdf_source = pdf_input.read()
     
+    doc = _open_pdf(pdf_source)
+    page_count = len(doc)
     doc.close()
-    return image_paths
+    return pdf_source, page_count
 
-def extract_markdown_from_result(result):
+def _split_pages(page_count, chunk_count):
     """
-    从API结果中提取markdown内容
+    将页码按连续区间切分
     
     Args:
-        result (dict): API返回的结果
+        page_count (int): PDF总页数
+        chunk_count (int): 切分的区间数上限
         
     Returns:
-        dict: 包含markdown内容的字典，格式为 {'pageX': 'markdown内容'}
+        list: 按页顺序排列的页码区间（range）列表
+    """
+    chunk_size = max(1, -(-page_count // max(1, chunk_count)))
+    return [range(start, min(start + chunk_size, page_count))
+            for start in range(0, page_count, chunk_size)]
+
+def pdf_to_images(pdf_input, longest_side=DEFAULT_LONGEST_SIDE):
+    """
+    将PDF文件按页渲染为图像，直接按目标最长边渲染，无需二次缩放
+    
+    Args:
+        pdf_input (str, bytes or file-like object): PDF文件路径、PDF文件内容或文件对象
+        longest_side (int): 渲染后图像最长边的像素大小
+        
+    Returns:
+        list: 每页对应的cv2图像对象（BGR格式的numpy.ndarray）列表
+    """
+    pdf_source, page_count = _load_pdf(pdf_input)
+    return [image for _, image in _iter_pages(pdf_source, range(page_count), longest_side)]
+
+def _submit_render_tasks(pdf_source, page_count, longest_side):
     """
-    markdown_dict = {}
+    按页码区间提交渲染编码任务，结果按页顺序排列
     
-    for i, res in enumerate(result["layoutParsingResults"]):
-        page_key = f"page{i+1}"
-        markdown_dict[page_key] = res["markdown"]["text"]
+    渲染进程池已创建时，区间数为进程数的 RENDER_CHUNKS_PER_PROCESS 倍：
+    靠前的区间先完成，其请求可以在其余页面渲染期间发出；区间数有限，PDF内容的序列化次数也有限。
+    未创建进程池时，按 API_CONFIG["max_concurrency"] 页一批交给阻塞线程池依次渲染
     
-    return markdown_dict
+    Args:
+        pdf_source (str or bytes): PDF文件路径或PDF文件内容
+        page_count (int): PDF总页数
+        longest_side (int): 渲染后图像最长边的像素大小
+        
+    Returns:
+        list: 与页码区间顺序一致的asyncio.Future列表，每个结果为该区间的API请求体列表
+    """
+    pool = _render_pool
+    if pool is not None and min(_render_pool_size, page_count) > 1:
+        executor = pool
+        chunks = _split_pages(page_count, _render_pool_size * RENDER_CHUNKS_PER_PROCESS)
+    else:
+        executor = _blocking_pool
+        chunks = _split_pages(page_count, -(-page_count // API_CONFIG["max_concurrency"]))
+    return [asyncio.wrap_future(executor.submit(_render_payloads, pdf_source, chunk, longest_side))
+            for chunk in chunks]
+
+def build_page_result(page, md_content):
+    """
+    生成单页的输出结果，只有页码和markdown内容随页面变化
+    
+    Args:
+        page (int): 页码（从1开始）
+        md_content (str): 该页的markdown内容
+        
+    Returns:
+        dict: 单页结果，格式为 {'page': 1, 'ocrContent': {...}}
+    """
+    return {
+        "page": page,
+        "ocrContent": {
+            "backend": OCR_RESULT_BACKEND,
+            "version": OCR_RESULT_VERSION,
+            "results": {
+                "image": {
+                    "md_content": md_content
+                }
+            }
+        }
+    }
 
-def process_pdf_file(pdf_input, api_url, longest_side=DEFAULT_LONGEST_SIDE):
+async def process_pdf_file(pdf_input, api_url, longest_side=DEFAULT_LONGEST_SIDE):
     """
     处理PDF文件：转换、调整大小、解析布局，直接返回markdown内容
     
+    渲染编码与API请求流水线执行：页面按区间渲染并编码为请求体，每个区间就绪后立即发送该区间的请求，
+    内存中不保留原始像素；请求并发数由 API_CONFIG["max_concurrency"] 限制
+    
     Args:
-        pdf_input (str or file-like object): PDF文件路径或文件对象
+        pdf_input (str, bytes or file-like object): PDF文件路径、PDF文件内容或文件对象
         api_url (str): 布局解析API URL
         longest_side (int): 最长边像素大小
         
     Returns:
-        dict: 包含所有页面markdown内容的字典，格式为 {'page1': '内容', 'page2': '内容', ...}
+        list: 每页的解析结果列表，格式为 [{'page': 1, 'ocrContent': {...}}, ...]，由调用方负责序列化
     """
-    # 创建临时图像目录
-    temp_dir = "temp_pdf_images"
+    loop = asyncio.get_running_loop()
+    
+    # 1. 读取PDF并统计页数（在线程池中执行，不阻塞事件循环）
+    pdf_source, page_count = await loop.run_in_executor(_blocking_pool, _load_pdf, pdf_input)
+    logger.debug("PDF共 %d 页", page_count)
+    
+    debug_dir = os.getenv("DEBUG_SAVE_PAGES")
+    if debug_dir:
+        pathlib.Path(debug_dir).mkdir(parents=True, exist_ok=True)
+    
+    # 2. 按目标尺寸渲染并编码为请求体（图像已按目标尺寸渲染，无需再缩放）
+    render_futures = collections.deque(_submit_render_tasks(pdf_source, page_count, longest_side))
+    
+    # 3. 各区间的请求体就绪后立即并发调用API，按页顺序收集结果
+    semaphore = asyncio.Semaphore(API_CONFIG["max_concurrency"])
     
+    async def call_with_limit(payload):
+        async with semaphore:
+            response = await call_layout_parsing_api(api_url, payload)
+        # 在任务内检查结果：任一页失败时TaskGroup会取消其余仍在进行的请求
+        return process_layout_parsing_result(response)
+    
+    tasks = []
     try:
-        # 1. 转换PDF为图像
-        print(f"Converting PDF to images...")
-        image_paths = pdf_to_images(pdf_input, temp_dir)
-        print(f"✓ PDF转换完成，共 {len(image_paths)} 页")
-        
-        all_markdowns = []
+        async with asyncio.TaskGroup() as tg:
+            while render_futures:
+                # 取出后不再持有该区间的结果，请求体在发送完成后即可释放
+                for payload in await render_futures.popleft():
+                    tasks.append(tg.create_task(call_with_limit(payload)))
+    except ExceptionGroup as eg:
+        # 抛出首个失败原因，便于调用方直接展示错误信息
+        raise eg.exceptions[0]
+    finally:
+        # 处理失败时取消尚未开始的渲染任务
+        for future in render_futures:
+            future.cancel()
+    logger.debug("请求全部完成")
+    
+    all_markdowns = []
+    
+    # 4. 处理结果，提取markdown直接生成要求的JSON格式
+    for i, task in enumerate(tasks):
+        logger.debug("处理第 %d/%d 页", i + 1, len(tasks))
+        result = task.result()
         
-        for i, image_path in enumerate(image_paths):
-            print(f"\n--- 处理第 {i+1}/{len(image_paths)} 页 ---")
-            print(f"Processing image: {image_path}")
-            
-            # 2. 读取图像并调整大小
-            image = cv2.imread(image_path)
-            if image is None:
-                print(f"❌ 读取图像失败: {image_path}")
-                continue
-                
-            original_size = image.shape[:2]
-            resized_image = resize_longest_side(image, longest_side)
-            resized_size = resized_image.shape[:2]
-            print(f"✓ 图像调整大小: {original_size} → {resized_size}")
+        for res in result["layoutParsingResults"]:
+            content = res["markdown"]["text"]
             
-            # 3. 编码为Base64
-            image_data = encode_image_to_base64(resized_image)
-            print(f"✓ Base64编码完成，数据长度: {len(image_data)} 字符")
-            
-            # 4. 创建负载并调用API
-            payload = create_layout_parsing_payload(image_data)
-            print(f"✓ 请求负载创建完成")
-            
-            response = call_layout_parsing_api(api_url, payload)
-            print(f"✓ API调用成功，状态码: {response.status_code}")
-            
-            # 5. 处理结果并提取markdown
-            result = process_layout_parsing_result(response)
-            page_markdowns = extract_markdown_from_result(result)
-            
-            # 显示提取的markdown统计信息
-            for page_name, content in page_markdowns.items():
-                char_count = len(content)
+            # 显示提取的markdown统计信息（仅在DEBUG级别计算）
+            if logger.isEnabledFor(logging.DEBUG):
                 line_count = content.count('\n') + 1
-                print(f"✓ 提取 {page_name}: {char_count} 字符, {line_count} 行")
+                logger.debug("提取第 %d 页: %d 字符, %d 行", i + 1, len(content), line_count)
             
-            # 合并到总结果中 - 生成要求的JSON格式
-            for page_name, content in page_markdowns.items():
-                page_json = {
-                    "page": i + 1,
-                    "ocrContent": {
-                        "backend": "pipeline",
-                        "version": "2.5.4",
-                        "results": {
-                            "image": {
-                                "md_content": content
-                            }
-                        }
-                    }
-                }
-                all_markdowns.append(page_json)
-            print(f"✓ 第 {i+1} 页处理完成")
-            
-        print(f"\n🎉 所有页面处理完成!")
-        print(f"总页数: {len(all_markdowns)}")
+            all_markdowns.append(build_page_result(i + 1, content))
+    
+    if logger.isEnabledFor(logging.DEBUG):
         total_chars = sum(len(page["ocrContent"]["results"]["image"]["md_content"]) for page in all_markdowns)
-        print(f"总字符数: {total_chars}")
-        
-        # 转换为JSON字符串
-        import json
-        json_output = json.dumps(all_markdowns, ensure_ascii=False, indent=2)
-        print(f"✓ JSON输出完成，共 {len(json_output)} 字符")
-        print(f"JSON输出预览:\n{json_output[:20000]}...")  # 显示前200个字符
-        return json_output
-        
-    finally:
-        # 清理临时文件
-        if pathlib.Path(temp_dir).exists():
-            shutil.rmtree(temp_dir)
+        logger.debug("所有页面处理完成，总页数: %d，总字符数: %d", len(all_markdowns), total_chars)
+    
+    return all_markdowns
+
+
 
 